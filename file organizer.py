@@ -2,12 +2,18 @@
 File Organizer Pro - Ultimate Edition
 """
 import os
+import errno
 import hashlib
 import shutil
 import time
 import threading
 import json
+import mmap
+import sqlite3
 import webbrowser
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from tkinter import Menu
 from watchdog.observers import Observer
@@ -15,10 +21,22 @@ from watchdog.events import FileSystemEventHandler
 import customtkinter as ctk
 import pystray
 import schedule
-import pdfplumber
+import pypdfium2 as pdfium
 from PIL import Image, ImageTk, ImageDraw
 import keyring
 
+try:
+    from blake3 import blake3
+    HASH_NAME = "blake3"
+except ImportError:
+    blake3 = None
+    HASH_NAME = "blake2b"
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 CATEGORIES = {
     "Documents": [".pdf", ".docx", ".txt", ".xlsx", ".pptx"],
     "Images": [".jpg", ".png", ".webp", ".gif", ".svg"],
@@ -26,9 +44,18 @@ CATEGORIES = {
     "Archives": [".zip", ".rar", ".7z", ".tar"],
     "Code": [".py", ".js", ".html", ".css", ".json"],
 }
+EXT_TO_CATEGORY = {ext: cat for cat, exts in CATEGORIES.items() for ext in exts}
 
 SCHEDULE_CONFIG = Path.home() / ".file_organizer_schedule.json"
 PREVIEW_TEMP = Path.home() / ".file_organizer_previews"
+HASH_CACHE = Path.home() / ".file_organizer_hashcache.sqlite"
+SAMPLE_SIZE = 65536
+MMAP_HASH_SIZE = 1024 * 1024
+BLAKE3_MMAP_SIZE = 16 * 1024 * 1024
+HASH_BATCH_SIZE = 500
+PREVIEW_CACHE_SIZE = 128
+EVENT_QUIET_SECONDS = 0.5
+EVENT_POLL_SECONDS = 0.25
 
 # ---------------------------- Core Engine ----------------------------
 class FileOrganizerEngine:
@@ -37,9 +64,26 @@ class FileOrganizerEngine:
     def __init__(self, root_path):
         self.root_path = Path(root_path)
         self.custom_rules = self._load_custom_rules()
+        self._rule_items = list(self.custom_rules.items())
+        self._rule_automaton = self._build_rule_automaton()
         self.observer = None
+        self.event_handler = None
         self.running = False
         self.scheduler_running = False
+        self._size_index_by_cat = {}
+        self._scanned_categories = {}
+        self._index_generation = 0
+        self._index_lock = threading.Lock()
+        self._bucket_locks = {}
+        self._fingerprints = {}
+        self._hash_cache_this_run = {}
+        self._cache_lock = threading.Lock()
+        self._hash_cache = self._open_hash_cache()
+        self._pending_hashes = {}
+        self._stale_hashes = set()
+        self._preview_cache = OrderedDict()
+        self._preview_lock = threading.Lock()
+        self._dirs_made = set()
         self._setup_workspace()
         self._setup_preview_temp()
 
@@ -52,6 +96,15 @@ class FileOrganizerEngine:
         """Create directory for preview thumbnails"""
         PREVIEW_TEMP.mkdir(exist_ok=True)
 
+    def _open_hash_cache(self):
+        """Open persistent hash cache keyed by path, size and mtime"""
+        conn = sqlite3.connect(HASH_CACHE, check_same_thread=False, isolation_level=None)
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS hashes_{HASH_NAME} ("
+            "abs_path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash BLOB)"
+        )
+        return conn
+
     def _load_custom_rules(self):
         """Load user-defined organization rules"""
         config_path = Path.home() / ".file_organizer_config.json"
@@ -61,20 +114,41 @@ class FileOrganizerEngine:
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
+    def _build_rule_automaton(self):
+        """Compile custom rule patterns into one Aho-Corasick automaton"""
+        if ahocorasick is None or not self._rule_items:
+            return None
+        automaton = ahocorasick.Automaton()
+        for idx, (pattern, category) in enumerate(self._rule_items):
+            automaton.add_word(pattern, (idx, category))
+        automaton.make_automaton()
+        return automaton
+
     def organize_existing_files(self, progress_callback=None):
         """Organize existing files with progress reporting"""
-        files = list(self.root_path.glob("*.*"))
-        for idx, file_path in enumerate(files):
-            if file_path.is_file():
-                self._process_file(file_path)
-                if progress_callback:
-                    progress_callback((idx + 1) / len(files))
+        self._hash_cache_this_run.clear()
+        self._dirs_made.clear()
+        generation = self._reset_index()
+        with os.scandir(self.root_path) as entries:
+            files = [
+                Path(entry.path) for entry in entries
+                if "." in entry.name and entry.is_file()
+            ]
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for idx, _ in enumerate(executor.map(self._try_process_file, files, repeat(generation))):
+                    if progress_callback:
+                        progress_callback((idx + 1) / len(files))
+            self._prune_hash_cache()
+        finally:
+            self._flush_hash_cache()
 
     def start_real_time_monitoring(self):
         """Begin watching directory for real-time organization"""
-        event_handler = FileEventHandler(self)
+        self.event_handler = FileEventHandler(self)
         self.observer = Observer()
-        self.observer.schedule(event_handler, self.root_path, recursive=False)
+        self.observer.schedule(self.event_handler, self.root_path, recursive=False)
         self.observer.start()
         self.running = True
 
@@ -83,47 +157,95 @@ class FileOrganizerEngine:
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        if self.event_handler:
+            self.event_handler.stop()
+        self._flush_hash_cache()
         self.running = False
 
-    def _process_file(self, file_path):
-        """Main file processing logic"""
-        if self._is_duplicate(file_path):
-            self._handle_duplicate(file_path)
-            return
+    def _try_process_file(self, file_path, generation=None):
+        """Process one file, skipping it on any error so the run continues"""
+        try:
+            self._process_file(file_path, generation)
+        except Exception:
+            pass
 
+    def _process_file(self, file_path, generation=None):
+        """Main file processing logic"""
+        # Batches share one index generation; a lone call rescans what it touches
+        if generation is None:
+            generation = self._reset_index()
         category = self._determine_category(file_path)
-        target_dir = self.root_path / category
-        target_dir.mkdir(exist_ok=True)
-        
-        try:
-            shutil.move(str(file_path), str(target_dir))
-        except PermissionError:
-            pass  # Handle locked files gracefully
+        key = (category, file_path.stat().st_size)
+        # Duplicates can only share a category and size, so the check-and-move
+        # is serialized per bucket and different buckets run in parallel
+        with self._bucket_locks.setdefault(key, threading.Lock()):
+            if self._is_duplicate(file_path, key, generation):
+                self._fingerprints.pop(file_path, None)
+                self._hash_cache_this_run.pop(file_path, None)
+                self._drop_cached_hash(file_path)
+                self._handle_duplicate(file_path)
+                return
+
+            target_dir = self.root_path / category
+            if target_dir not in self._dirs_made:
+                target_dir.mkdir(exist_ok=True)
+                self._dirs_made.add(target_dir)
+
+            dest = target_dir / file_path.name
+            try:
+                self._move(file_path, dest)
+            except PermissionError:
+                return  # Handle locked files gracefully
+            except FileNotFoundError:
+                if target_dir.exists():
+                    raise
+                # Category folder was removed since it was created
+                target_dir.mkdir()
+                self._move(file_path, dest)
+            self._track_move(file_path, dest, key)
 
     def generate_preview(self, file_path):
         """Generate preview for supported file types"""
         preview_path = PREVIEW_TEMP / f"preview_{file_path.name}"
         try:
+            # Reuse the preview while it still holds this version of the file
+            stat = file_path.stat()
+            source_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+            with self._preview_lock:
+                if self._preview_cache.get(preview_path) == source_key and preview_path.exists():
+                    self._preview_cache.move_to_end(preview_path)
+                    return preview_path
+
             if file_path.suffix.lower() in [".jpg", ".png", ".webp"]:
                 self._generate_image_preview(file_path, preview_path)
             elif file_path.suffix == ".pdf":
                 self._generate_pdf_preview(file_path, preview_path)
             elif file_path.suffix == ".txt":
                 self._generate_text_preview(file_path, preview_path)
+
+            with self._preview_lock:
+                self._preview_cache[preview_path] = source_key
+                self._preview_cache.move_to_end(preview_path)
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
             return preview_path
         except Exception as e:
             return None
 
     def _generate_image_preview(self, src, dest):
         with Image.open(src) as img:
-            img.thumbnail((200, 200))
-            img.save(dest, "PNG")
+            img.draft("RGB", (200, 200))  # Let JPEG decode at reduced scale
+            img.thumbnail((200, 200), Image.Resampling.BILINEAR)
+            img.save(dest, "PNG", optimize=False, compress_level=1)
 
     def _generate_pdf_preview(self, src, dest):
-        with pdfplumber.open(src) as pdf:
-            first_page = pdf.pages[0]
-            im = first_page.to_image()
-            im.save(dest, "PNG")
+        pdf = pdfium.PdfDocument(src)
+        try:
+            im = pdf[0].render(scale=0.3).to_pil()
+        finally:
+            pdf.close()
+        im.thumbnail((200, 200))
+        im.save(dest, "PNG")
 
     def _generate_text_preview(self, src, dest):
         with open(src, "r") as f:
@@ -133,39 +255,336 @@ class FileOrganizerEngine:
 
     def _determine_category(self, file_path):
         """Determine file category using multiple strategies"""
-        for pattern, category in self.custom_rules.items():
-            if pattern in file_path.name.lower():
-                return category
-        
-        ext = file_path.suffix.lower()
-        for category, extensions in CATEGORIES.items():
-            if ext in extensions:
-                return category
-        
-        return "Miscellaneous"
-
-    def _is_duplicate(self, file_path):
-        """Check for duplicate files using content hashing"""
-        file_hash = self._generate_file_hash(file_path)
-        for existing_file in self.root_path.rglob("*.*"):
-            if existing_file != file_path and file_hash == self._generate_file_hash(existing_file):
-                return True
+        name = file_path.name.lower()
+        if self._rule_automaton is not None:
+            # Earliest rule wins, matching the order of the config file
+            matches = [rule for _, rule in self._rule_automaton.iter(name)]
+            if matches:
+                return min(matches)[1]
+        else:
+            for pattern, category in self._rule_items:
+                if pattern in name:
+                    return category
+
+        return EXT_TO_CATEGORY.get(file_path.suffix.lower(), "Miscellaneous")
+
+    def _is_duplicate(self, file_path, key, generation):
+        """Check the target category by size, then sampled fingerprint, then full hash"""
+        same_size = self._size_bucket(key, generation)
+        if not same_size:
+            return False
+
+        fingerprint = self._fingerprint(file_path)
+        same_fp = []
+        for path, (size, mtime_ns) in list(same_size.items()):
+            try:
+                stat = path.stat()
+                if stat.st_size != size:
+                    # Edited to a new size since it was indexed
+                    self._forget(path, key)
+                    self._index_entry(key[0], path, stat)
+                    continue
+                if stat.st_mtime_ns != mtime_ns:
+                    same_size[path] = (stat.st_size, stat.st_mtime_ns)
+                if self._fingerprint(path) == fingerprint:
+                    same_fp.append(path)
+            except FileNotFoundError:
+                self._forget(path, key)
+        if not same_fp:
+            return False
+
+        file_hash = self._hash(file_path)
+        for path in same_fp:
+            try:
+                if self._hash(path) == file_hash:
+                    return True
+            except FileNotFoundError:
+                self._forget(path, key)
         return False
 
-    def _generate_file_hash(self, file_path, block_size=65536):
-        """Generate MD5 hash of file contents"""
-        hasher = hashlib.md5()
+    def _reset_index(self):
+        """Start a new index generation so category folders are rescanned on next use"""
+        with self._index_lock:
+            self._index_generation += 1
+            return self._index_generation
+
+    def _forget(self, file_path, key):
+        """Remove a file that left its (category, size) bucket from the index"""
+        self._hash_cache_this_run.pop(file_path, None)
+        self._drop_cached_hash(file_path)
+        self._size_index_by_cat.get(key[0], {}).get(key[1], {}).pop(file_path, None)
+        self._fingerprints.pop(file_path, None)
+
+    def _index_entry(self, category, file_path, stat):
+        """Add a file to a scanned category's size buckets"""
+        buckets = self._size_index_by_cat.get(category)
+        if buckets is not None:
+            buckets.setdefault(stat.st_size, {})[file_path] = (stat.st_size, stat.st_mtime_ns)
+
+    def _size_bucket(self, key, generation):
+        """Return {path: (size, mtime_ns)} for indexed files sharing a (category, size) key"""
+        category, size = key
+        with self._index_lock:
+            scanned = self._scanned_categories.get(category)
+            dir_mtime_ns = self._dir_mtime_ns(category)
+            # Rescan once per generation, or when files were added or removed
+            if scanned is None or scanned[0] < generation or scanned[1] != dir_mtime_ns:
+                self._scan_category(category)
+                self._scanned_categories[category] = (generation, dir_mtime_ns)
+            return self._size_index_by_cat[category].setdefault(size, {})
+
+    def _dir_mtime_ns(self, category):
+        """Return a category folder's mtime, or None if it does not exist"""
+        try:
+            return (self.root_path / category).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _scan_category(self, category):
+        """Bucket the files currently in a category folder by size"""
+        buckets = {}
+        try:
+            entries = list(self._scandir_recursive(self.root_path / category))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                buckets.setdefault(stat.st_size, {})[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+        self._size_index_by_cat[category] = buckets
+
+    def _scandir_recursive(self, root):
+        """Yield non-directory entries below root using cached d_type info"""
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+
+    def _fingerprint(self, file_path):
+        """Return a file's sampled fingerprint, memoized while its size and mtime are unchanged"""
+        stat = file_path.stat()
+        entry = self._fingerprints.get(file_path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        fingerprint = self._sampled_fingerprint(file_path, stat.st_size)
+        self._fingerprints[file_path] = (stat.st_size, stat.st_mtime_ns, fingerprint)
+        return fingerprint
+
+    def _sampled_fingerprint(self, file_path, size):
+        """Hash the first, middle and last blocks of large files, small files in full"""
         with open(file_path, 'rb') as f:
-            for block in iter(lambda: f.read(block_size), b''):
-                hasher.update(block)
-        return hasher.hexdigest()
+            if size <= 3 * SAMPLE_SIZE:
+                return hashlib.md5(f.read()).digest()
+            head = f.read(SAMPLE_SIZE)
+            f.seek(size // 2)
+            middle = f.read(SAMPLE_SIZE)
+            f.seek(size - SAMPLE_SIZE)
+            tail = f.read(SAMPLE_SIZE)
+        return hashlib.md5(
+            hashlib.md5(head).digest()
+            + hashlib.md5(middle).digest()
+            + hashlib.md5(tail).digest()
+        ).digest()
+
+    def _track_move(self, src, dest, key):
+        """Index a file moved into its category folder and carry over its cache entry"""
+        with self._index_lock:
+            self._index_entry(key[0], dest, dest.stat())
+            # Our own move changed the folder mtime; don't treat it as outside change
+            scanned = self._scanned_categories.get(key[0])
+            if scanned is not None:
+                self._scanned_categories[key[0]] = (scanned[0], self._dir_mtime_ns(key[0]))
+        # A rename keeps size and mtime, so the memoized entries stay valid
+        fp_entry = self._fingerprints.pop(src, None)
+        if fp_entry is not None:
+            self._fingerprints[dest] = fp_entry
+        hash_entry = self._hash_cache_this_run.pop(src, None)
+        # Files never hashed this run have no cache row worth carrying over
+        if hash_entry is not None:
+            self._hash_cache_this_run[dest] = hash_entry
+            self._drop_cached_hash(src)
+            self._cache_hash(os.path.abspath(dest), *hash_entry)
+
+    def _hash(self, file_path):
+        """Return a file's hash, memoized while its size and mtime are unchanged"""
+        stat = file_path.stat()
+        entry = self._hash_cache_this_run.get(file_path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        file_hash = self._generate_file_hash(file_path)
+        self._hash_cache_this_run[file_path] = (stat.st_size, stat.st_mtime_ns, file_hash)
+        return file_hash
+
+    def _generate_file_hash(self, file_path):
+        """Generate BLAKE3 (or BLAKE2b) hash of file contents, reusing cached digests"""
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        with self._cache_lock:
+            row = self._pending_hashes.get(abs_path) or self._lookup_cached_hash(abs_path)
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        if blake3 is not None and stat.st_size > BLAKE3_MMAP_SIZE:
+            # Worker threads only pay off on large inputs
+            hasher = blake3(max_threads=blake3.AUTO)
+            hasher.update_mmap(abs_path)
+        else:
+            hasher = blake3() if blake3 is not None else hashlib.blake2b()
+            if stat.st_size >= MMAP_HASH_SIZE:
+                with open(abs_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+            else:
+                with open(abs_path, 'rb') as f:
+                    hasher.update(f.read())
+        file_hash = hasher.hexdigest()
+        self._cache_hash(abs_path, stat.st_size, stat.st_mtime_ns, file_hash)
+        return file_hash
+
+    def _lookup_cached_hash(self, abs_path):
+        """Fetch (size, mtime_ns, hash) for a path; caller holds the cache lock"""
+        return self._hash_cache.execute(
+            f"SELECT size, mtime_ns, hash FROM hashes_{HASH_NAME} WHERE abs_path = ?",
+            (abs_path,)
+        ).fetchone()
+
+    def _cache_hash(self, abs_path, size, mtime_ns, file_hash):
+        """Queue a digest for the cache, writing once a full batch is pending"""
+        with self._cache_lock:
+            self._pending_hashes[abs_path] = (size, mtime_ns, file_hash)
+            batch_full = len(self._pending_hashes) >= HASH_BATCH_SIZE
+        if batch_full:
+            self._flush_hash_cache()
+
+    def _drop_cached_hash(self, file_path):
+        """Queue removal of a path's cache row once the file has left it"""
+        abs_path = os.path.abspath(file_path)
+        with self._cache_lock:
+            self._pending_hashes.pop(abs_path, None)
+            self._stale_hashes.add(abs_path)
+
+    def _prune_hash_cache(self):
+        """Queue removal of cache rows for files under the root that no longer exist"""
+        prefix = os.path.join(os.path.abspath(self.root_path), "")
+        with self._cache_lock:
+            rows = self._hash_cache.execute(
+                f"SELECT abs_path FROM hashes_{HASH_NAME} WHERE substr(abs_path, 1, ?) = ?",
+                (len(prefix), prefix)
+            ).fetchall()
+        for (abs_path,) in rows:
+            if not os.path.exists(abs_path):
+                self._drop_cached_hash(abs_path)
+
+    def _flush_hash_cache(self):
+        """Write queued digests and drop moved paths in a single transaction"""
+        with self._cache_lock:
+            if not self._pending_hashes and not self._stale_hashes:
+                return
+            with self._hash_cache:
+                self._hash_cache.execute("BEGIN IMMEDIATE")
+                self._hash_cache.executemany(
+                    f"DELETE FROM hashes_{HASH_NAME} WHERE abs_path = ?",
+                    [(path,) for path in self._stale_hashes]
+                )
+                self._hash_cache.executemany(
+                    f"INSERT OR REPLACE INTO hashes_{HASH_NAME} VALUES (?, ?, ?, ?)",
+                    [(path, *row) for path, row in self._pending_hashes.items()]
+                )
+            self._pending_hashes.clear()
+            self._stale_hashes.clear()
 
     def _handle_duplicate(self, file_path):
         """Move duplicate to dedicated folder with timestamp"""
         timestamp = int(time.time())
         new_name = f"{timestamp}_{file_path.name}"
         dest = self.root_path / "Duplicates" / new_name
-        shutil.move(str(file_path), str(dest))
+        self._move(file_path, dest)
+
+    def _move(self, src, dest):
+        """Rename within a filesystem, copying only across filesystems"""
+        if dest.exists():
+            raise FileExistsError(errno.EEXIST, "Destination path already exists", str(dest))
+        try:
+            os.replace(src, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dest))
+
+class FileEventHandler(FileSystemEventHandler):
+    """Coalesces watchdog events and organizes files once writes settle"""
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        threading.Thread(target=self._drain_loop, daemon=True).start()
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._queue(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._queue(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._queue(event.dest_path)
+
+    def stop(self):
+        """Stop the drain thread, dropping pending events"""
+        self._stopped.set()
+
+    def _queue(self, path):
+        """Record activity on a root-level file, restarting its quiet period"""
+        path = Path(path)
+        if path.parent == self.engine.root_path and "." in path.name:
+            with self._lock:
+                self._pending[path] = (time.monotonic(), None)
+
+    def _drain_loop(self):
+        """Process files that are quiet and whose size held across two samples"""
+        while not self._stopped.wait(EVENT_POLL_SECONDS):
+            now = time.monotonic()
+            ready = []
+            with self._lock:
+                for path, (last_event, last_size) in list(self._pending.items()):
+                    if now - last_event < EVENT_QUIET_SECONDS:
+                        continue
+                    try:
+                        size = path.stat().st_size
+                    except OSError:
+                        del self._pending[path]  # Gone or already organized
+                        continue
+                    if size == last_size:
+                        del self._pending[path]
+                        ready.append(path)
+                    else:
+                        self._pending[path] = (last_event, size)
+
+            # Never let one bad file or cache write end monitoring
+            if not ready:
+                continue
+            # Rescan category folders once per batch to see outside changes
+            generation = self.engine._reset_index()
+            for path in ready:
+                try:
+                    self.engine._process_file(path, generation)
+                except Exception:
+                    pass
+            try:
+                self.engine._flush_hash_cache()
+            except Exception:
+                pass
 
 class TrayManager:
     """Handles system tray integration and notifications"""
@@ -198,7 +617,11 @@ class TrayManager:
 
     def exit_app(self):
         """Clean shutdown procedure"""
+        self.app._closing = True
         self.app.organizer.stop_real_time_monitoring()
+        self.app._preview_pool.shutdown(wait=False, cancel_futures=True)
+        if self.app._scheduler_stop:
+            self.app._scheduler_stop.set()
         self.app.destroy()
         self.icon.stop()
 
@@ -209,7 +632,13 @@ class FileOrganizerApp(ctk.CTk):
     def __init__(self):
         super().__init__()
         self.organizer = None
+        self._preview_pool = ThreadPoolExecutor(max_workers=2)
+        self._preview_request = None
+        self._closing = False
+        self._scheduler_stop = None
+        self._log_queue = deque()
         self._setup_ui()
+        self.after(100, self._flush_log)
         self._load_settings()
         self.tray = TrayManager(self)
         self.protocol("WM_DELETE_WINDOW", self.minimize_to_tray)
@@ -332,8 +761,21 @@ class FileOrganizerApp(ctk.CTk):
             menu.tk_popup(event.x_root, event.y_root)
 
     def show_preview(self, file_path):
-        """Display file preview"""
-        preview_path = self.organizer.generate_preview(Path(file_path))
+        """Render file preview in the background and display it when ready"""
+        self._preview_request = file_path
+        future = self._preview_pool.submit(self.organizer.generate_preview, Path(file_path))
+        future.add_done_callback(lambda f: self._on_preview_done(file_path, f))
+
+    def _on_preview_done(self, file_path, future):
+        """Hand a finished preview to the UI thread unless cancelled or closing"""
+        if future.cancelled() or self._closing:
+            return
+        self.after(0, self._apply_preview, file_path, future.result())
+
+    def _apply_preview(self, file_path, preview_path):
+        """Show a rendered preview unless a newer one was requested"""
+        if file_path != self._preview_request:
+            return
         if preview_path:
             if Path(file_path).suffix.lower() in [".jpg", ".png", ".pdf"]:
                 img = ctk.CTkImage(Image.open(preview_path), size=(200, 200))
@@ -371,11 +813,21 @@ class FileOrganizerApp(ctk.CTk):
             time_str = config["schedule"].split("at ")[-1]
             schedule.every().day.at(time_str).do(self._run_scheduled_cleanup)
         
+        # Replace any previous scheduler thread instead of stacking another
+        if self._scheduler_stop:
+            self._scheduler_stop.set()
+        stop = self._scheduler_stop = threading.Event()
+
         def scheduler_thread():
-            while True:
+            while not stop.is_set():
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    stop.wait(3600)
+                    continue
+                if idle > 0 and stop.wait(idle):
+                    break
                 schedule.run_pending()
-                time.sleep(60)
-        
+
         threading.Thread(target=scheduler_thread, daemon=True).start()
 
     def _run_scheduled_cleanup(self):
@@ -395,8 +847,17 @@ class FileOrganizerApp(ctk.CTk):
     def _log_action(self, message):
         """Add timestamped message to activity log"""
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        self.log.insert("end", f"[{timestamp}] {message}\n")
-        self.log.see("end")
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+
+    def _flush_log(self):
+        """Write queued log lines to the textbox in one batch"""
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if lines:
+            self.log.insert("end", "".join(lines))
+            self.log.see("end")
+        self.after(100, self._flush_log)
 
 if __name__ == "__main__":
     app = FileOrganizerApp()